@@ -5,6 +5,8 @@ REGION="YOUR_PREFERRED_REGION"
 ARTIFACT_REGISTRY="YOUR_REGISTRY_NAME"
 IMAGE_NAME="news-scraper"
 SERVICE_NAME="news-scraper-service"
+BQ_DATASET_ID="news_data"
+BQ_TABLE_ID="articles"
 
 GREEN='\033[0;32m'
 RED='\033[0;31m'
@@ -12,6 +14,14 @@ NC='\033[0m'
 
 echo "Starting deployment process..."
 
+echo -e "${GREEN}Checking BigQuery table schema...${NC}"
+SCRAPE_DATE_TYPE=$(bq show --schema --format=json ${PROJECT_ID}:${BQ_DATASET_ID}.${BQ_TABLE_ID} 2>/dev/null \
+    | python3 -c "import json, sys; print(next((f['type'] for f in json.load(sys.stdin) if f['name'] == 'scrape_date'), ''))" 2>/dev/null)
+if [ "${SCRAPE_DATE_TYPE}" = "STRING" ]; then
+    echo -e "${RED}Table ${BQ_DATASET_ID}.${BQ_TABLE_ID} stores scrape_date as STRING; migrate it to TIMESTAMP first (see README)${NC}"
+    exit 1
+fi
+
 echo -e "${GREEN}Building Docker image...${NC}"
 docker build -t ${IMAGE_NAME} .
 if [ $? -ne 0 ]; then
@@ -36,8 +46,8 @@ gcloud run deploy ${SERVICE_NAME} \
     --region ${REGION} \
     --project ${PROJECT_ID} \
     --set-env-vars "GCP_PROJECT_ID=${PROJECT_ID}" \
-    --set-env-vars "BQ_DATASET_ID=news_data" \
-    --set-env-vars "BQ_TABLE_ID=articles" \
+    --set-env-vars "BQ_DATASET_ID=${BQ_DATASET_ID}" \
+    --set-env-vars "BQ_TABLE_ID=${BQ_TABLE_ID}" \
     --service-account="news-scraper@${PROJECT_ID}.iam.gserviceaccount.com"
 
 if [ $? -eq 0 ]; then
@@ -1,14 +1,27 @@
+import atexit
+import io
 import logging
+import multiprocessing
 import os
 import sys
 import time
-from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Dict, List, Optional
+from datetime import datetime, timezone
+from email.message import Message
+from multiprocessing.util import Finalize
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin
 
-import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+import requests
 from google.cloud import bigquery
+from lxml import etree
+from lxml import html as lxml_html
+from requests.adapters import HTTPAdapter
 from selenium import webdriver
 from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
 from selenium.webdriver.chrome.options import Options
@@ -23,7 +36,46 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-@dataclass
+DEFAULT_BQ_CHUNK_SIZE = 10000
+BQ_SCHEMA = [
+    bigquery.SchemaField("title", "STRING"),
+    bigquery.SchemaField("kicker", "STRING"),
+    bigquery.SchemaField("link", "STRING"),
+    bigquery.SchemaField("image", "STRING"),
+    bigquery.SchemaField("scrape_date", "TIMESTAMP"),
+    bigquery.SchemaField("title_word_count", "INTEGER"),
+    bigquery.SchemaField("title_char_count", "INTEGER"),
+    bigquery.SchemaField("capital_words", "STRING", mode="REPEATED")
+]
+
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/90.0.4430.212 Safari/537.36'
+ARTICLE_KICKER_CSS = ".volanta_noticia, .titulo_de_noticia .volanta_noticia"
+EXTRACT_LISTING_SCRIPT = """
+const text = el => el ? el.innerText.replace(/\\s+/g, ' ').trim() : '';
+return Array.from(document.querySelectorAll('.contenedor_dato_modulo'), container => {
+    const link = container.querySelector('.titulo a');
+    const kicker = Array.from(container.querySelectorAll('.volanta, .volanta_noticia'), text).find(Boolean);
+    const image = container.querySelector('img');
+    return {
+        title: text(link),
+        link: link ? link.href : '',
+        kicker: kicker || '',
+        image: image ? image.src : ''
+    };
+});
+"""
+FETCH_PAGES_SCRIPT = """
+const [urls, done] = arguments;
+Promise.all(urls.map(url =>
+    fetch(url, {signal: AbortSignal.timeout(10000)}).then(r => r.ok ? r.text() : null).catch(() => null)
+)).then(done);
+"""
+
+_worker_chrome_options = None
+_worker_driver = None
+
+@dataclass(slots=True)
 class Article:
     """Data class to store article information"""
     title: str
@@ -32,8 +84,40 @@ class Article:
     image: str
     scrape_date: str = None
 
-    def __post_init__(self):
-        self.scrape_date = datetime.now().isoformat()
+def _filter_list_values(lists: pa.ListArray, mask: pa.BooleanArray) -> pa.ListArray:
+    """Keep the list values selected by mask, preserving the row each value belongs to"""
+    kept = pc.cumulative_sum(pc.cast(mask, pa.int32()))
+    offsets = pc.take(pa.concat_arrays([pa.array([0], pa.int32()), kept]), lists.offsets)
+    return pa.ListArray.from_arrays(offsets, pc.filter(pc.list_flatten(lists), mask))
+
+def _split_words(titles: pa.StringArray) -> pa.ListArray:
+    """Split each title on Unicode whitespace, dropping empty tokens like str.split()"""
+    tokens = pc.utf8_split_whitespace(titles)
+    return _filter_list_values(tokens, pc.greater(pc.utf8_length(pc.list_flatten(tokens)), 0))
+
+def _declared_charset(response: requests.Response) -> Optional[str]:
+    """Return the charset named in the response's Content-Type header, if any"""
+    message = Message()
+    message['Content-Type'] = response.headers.get('Content-Type', '')
+    return message.get_content_charset()
+
+def _has_class(name: str) -> str:
+    """Build an XPath predicate matching a whole token of the class attribute"""
+    return f"contains(concat(' ',normalize-space(@class),' '),' {name} ')"
+
+def _init_kicker_worker(chrome_options: Options) -> None:
+    """Store the Chrome options used by this kicker pool worker"""
+    global _worker_chrome_options
+    _worker_chrome_options = chrome_options
+
+def fetch_kicker(url: str) -> Tuple[str, str]:
+    """Get kicker from an article page using a WebDriver owned by the current process"""
+    global _worker_driver
+    if _worker_driver is None:
+        _worker_driver = webdriver.Chrome(service=Service(), options=_worker_chrome_options)
+        _worker_driver.set_page_load_timeout(30)
+        Finalize(None, _worker_driver.quit, exitpriority=10)
+    return url, NewsScraperProcessor._get_article_kicker(_worker_driver, url)
 
 class NewsScraperProcessor:
     def __init__(self):
@@ -41,6 +125,43 @@ class NewsScraperProcessor:
         self.chrome_options = self._configure_chrome_options()
         self.max_retries = 3
         self.retry_delay = 5
+        self.kicker_workers = 16
+        self.kicker_processes = 4
+        self.bq_chunk_size = self._get_bq_chunk_size()
+        self.bq_upload_workers = 4
+        self._session = self._create_session()
+        self._bq_client = None
+        self._run_ts = None
+        self._driver = None
+        atexit.register(self.close)
+        self._title_xp = etree.XPath(f"descendant::*[{_has_class('titulo')}]//a[1]")
+        self._kicker_xp = etree.XPath(
+            f"descendant::*[{_has_class('volanta')} or {_has_class('volanta_noticia')}][normalize-space()][1]"
+        )
+        self._image_xp = etree.XPath(".//img[1]/@src")
+        self._article_kicker_xp = etree.XPath(f"descendant::*[{_has_class('volanta_noticia')}][normalize-space()][1]")
+        self._text_xp = etree.XPath("normalize-space()")
+
+    def _get_bq_chunk_size(self) -> int:
+        """Read BQ_CHUNK_SIZE, falling back to the default when it is not a positive integer"""
+        value = os.getenv('BQ_CHUNK_SIZE')
+        if value is None:
+            return DEFAULT_BQ_CHUNK_SIZE
+        try:
+            chunk_size = int(value)
+        except ValueError:
+            chunk_size = 0
+        if chunk_size <= 0:
+            logger.warning(f"Invalid BQ_CHUNK_SIZE {value!r}, using {DEFAULT_BQ_CHUNK_SIZE}")
+            return DEFAULT_BQ_CHUNK_SIZE
+        return chunk_size
+
+    @property
+    def bq_client(self) -> bigquery.Client:
+        """BigQuery client, created on first use and reused across uploads"""
+        if self._bq_client is None:
+            self._bq_client = bigquery.Client()
+        return self._bq_client
 
     def _configure_chrome_options(self) -> Options:
         """Configure Chrome options for headless browsing"""
@@ -52,21 +173,43 @@ class NewsScraperProcessor:
         options.add_argument('--window-size=1920,1080')
         options.add_argument('--disable-notifications')
         options.add_argument('--disable-software-rasterizer')
-        options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/90.0.4430.212 Safari/537.36')
+        options.add_argument(f'user-agent={USER_AGENT}')
+        options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.managed_default_content_settings.stylesheets': 2,
+            'profile.managed_default_content_settings.fonts': 2,
+            'profile.managed_default_content_settings.plugins': 2
+        })
+        options.page_load_strategy = 'eager'
         return options
 
-    @contextmanager
-    def _create_driver(self):
-        """Context manager for creating and managing the WebDriver"""
-        driver = None
+    def _create_session(self) -> requests.Session:
+        """Create a pooled HTTP session for fetching article pages without a browser"""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.kicker_workers, pool_maxsize=self.kicker_workers)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers.update({'User-Agent': USER_AGENT})
+        return session
+
+    @property
+    def driver(self) -> webdriver.Chrome:
+        """WebDriver shared across scrape calls, started on first use"""
+        if self._driver is None:
+            self._driver = webdriver.Chrome(service=Service(), options=self.chrome_options)
+            self._driver.set_page_load_timeout(30)
+        return self._driver
+
+    def close(self) -> None:
+        """Quit the shared WebDriver if it is running"""
+        if self._driver is None:
+            return
         try:
-            service = Service()
-            driver = webdriver.Chrome(service=service, options=self.chrome_options)
-            driver.set_page_load_timeout(30)
-            yield driver
+            self._driver.quit()
+        except Exception as e:
+            logger.debug(f"Error quitting WebDriver: {str(e)}")
         finally:
-            if driver:
-                driver.quit()
+            self._driver = None
 
     def _safe_find_element(self, container, by, value, default=""):
         """Safely find an element and return its text or attribute"""
@@ -81,9 +224,10 @@ class NewsScraperProcessor:
 
     def scrape_news(self) -> List[Article]:
         """Main scraping method with retry mechanism"""
+        self._run_ts = datetime.now(timezone.utc).isoformat()
         for attempt in range(self.max_retries):
             try:
-                articles = self._scrape_with_selenium()
+                articles = self._scrape_with_requests() or self._scrape_with_selenium()
                 if articles:
                     return articles
                 logger.warning(f"Attempt {attempt + 1} yielded no articles")
@@ -97,212 +241,323 @@ class NewsScraperProcessor:
                     raise
         return []
 
-    def _get_article_kicker(self, driver, url: str) -> str:
+    @staticmethod
+    def _get_article_kicker(driver, url: str) -> str:
         """Get kicker from individual article page if needed"""
         try:
             driver.get(url)
             WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "volanta_noticia"))
+                EC.presence_of_element_located((By.CLASS_NAME, "contenido_noticia"))
             )
 
-            kicker_selectors = [
-                (By.CLASS_NAME, "volanta_noticia"),
-                (By.CLASS_NAME, "volanta_noticia fuente_roboto_slab"),
-                (By.CSS_SELECTOR, ".slot.contenido_fijo.titulo_de_noticia .volanta_noticia"),
-                (By.CSS_SELECTOR, ".titulo_de_noticia .volanta_noticia")
-            ]
-            
-            for selector in kicker_selectors:
-                try:
-                    element = driver.find_element(*selector)
-                    kicker_text = element.text.strip()
-                    if kicker_text:
-                        return kicker_text
-                except NoSuchElementException:
-                    continue
-                
+            for element in driver.find_elements(By.CSS_SELECTOR, ARTICLE_KICKER_CSS):
+                kicker_text = element.text.strip()
+                if kicker_text:
+                    return kicker_text
+
             return ""
         except Exception as e:
             logger.error(f"Error getting article kicker from {url}: {str(e)}")
             return ""
 
-    def _scrape_with_selenium(self) -> List[Article]:
-        """Scrape articles using Selenium with protection against stale elements"""
-        articles = []
-        
-        with self._create_driver() as driver:
+    def _fetch_kicker_http(self, url: str) -> str:
+        """Get kicker from individual article page over plain HTTP"""
+        try:
+            response = self._session.get(url, timeout=10)
+            if response.status_code != 200:
+                logger.debug(f"Got status {response.status_code} fetching article page: {url}")
+                return ""
+
+            return self._parse_article_kicker(response.content, _declared_charset(response))
+        except Exception as e:
+            logger.debug(f"Error fetching article page {url}: {str(e)}")
+            return ""
+
+    def _parse_article_kicker(self, page_source, encoding: Optional[str] = None) -> str:
+        """Extract the kicker from an article page's HTML"""
+        parser = lxml_html.HTMLParser(encoding=encoding) if encoding else None
+        kickers = self._article_kicker_xp(lxml_html.fromstring(page_source, parser=parser))
+        return self._text_xp(kickers[0]) if kickers else ""
+
+    def _fetch_kickers_in_page(self, driver, urls: List[str]) -> Dict[str, str]:
+        """Get kickers by fetching article HTML from inside the already loaded listing page"""
+        driver.set_script_timeout(30)
+        pages = driver.execute_async_script(FETCH_PAGES_SCRIPT, urls)
+
+        kickers = {}
+        for url, page_source in zip(urls, pages):
+            if not page_source:
+                continue
             try:
-                logger.info(f"Accessing URL: {self.base_url}")
-                try:
-                    driver.get(self.base_url)
-                except TimeoutException:
-                    logger.error(f"Timeout while accessing {self.base_url}")
-                    raise
-                except WebDriverException as e:
-                    logger.error(f"WebDriver error while accessing {self.base_url}: {str(e)}")
-                    raise
+                kickers[url] = self._parse_article_kicker(page_source)
+            except Exception as e:
+                logger.debug(f"Error parsing article page {url}: {str(e)}")
+        return kickers
 
-                try:
-                    WebDriverWait(driver, 20).until(
-                        EC.presence_of_element_located((By.CLASS_NAME, "contenedor_dato_modulo"))
-                    )
-                except TimeoutException:
-                    logger.error("Timeout waiting for article containers to load")
-                    raise
+    def _fetch_kickers_with_browser(self, urls: List[str]) -> Dict[str, str]:
+        """Get kickers by rendering article pages in a pool of browser processes"""
+        pool = multiprocessing.get_context('spawn').Pool(
+            processes=min(self.kicker_processes, len(urls)),
+            initializer=_init_kicker_worker,
+            initargs=(self.chrome_options,)
+        )
+        try:
+            return dict(pool.imap_unordered(fetch_kicker, urls))
+        finally:
+            pool.close()
+            pool.join()
+
+    def _fill_missing_kickers(self, article_data: List[Dict[str, str]], driver=None) -> None:
+        """Fetch kickers missing from the listing concurrently, using the browser only as a last resort"""
+        missing = [info for info in article_data if not info['kicker'] and info['link']]
+        if not missing:
+            return
+
+        logger.info(f"No kicker found in main page for {len(missing)} articles. Checking article pages...")
+        with ThreadPoolExecutor(max_workers=self.kicker_workers) as executor:
+            kickers = list(executor.map(self._fetch_kicker_http, [info['link'] for info in missing]))
+
+        for article_info, kicker in zip(missing, kickers):
+            article_info['kicker'] = kicker
+
+        missing = [info for info in missing if not info['kicker']]
+        if missing and driver is not None:
+            logger.info(f"Fetching {len(missing)} article pages from the browser session...")
+            try:
+                kickers = self._fetch_kickers_in_page(driver, [info['link'] for info in missing])
+            except Exception as e:
+                logger.error(f"Error fetching article pages in browser: {str(e)}")
+                kickers = {}
+
+            for article_info in missing:
+                article_info['kicker'] = kickers.get(article_info['link'], "")
+
+            missing = [info for info in missing if not info['kicker']]
+
+        if not missing:
+            return
+
+        logger.info(f"Falling back to rendering article pages for {len(missing)} articles...")
+        try:
+            kickers = self._fetch_kickers_with_browser([info['link'] for info in missing])
+        except Exception as e:
+            logger.error(f"Error fetching kickers with browser: {str(e)}")
+            return
+
+        for article_info in missing:
+            article_info['kicker'] = kickers.get(article_info['link'], "")
+
+    def _extract_listing_item(self, container, base_url: str) -> Optional[Dict[str, str]]:
+        """Extract article fields from a single listing container"""
+        try:
+            title_links = self._title_xp(container)
+            if not title_links:
+                return None
+
+            article_info = {
+                'title': self._text_xp(title_links[0]),
+                'link': urljoin(base_url, title_links[0].get("href", "")),
+                'kicker': '',
+                'image': ''
+            }
+            if not article_info['title']:
+                return None
+
+            kickers = self._kicker_xp(container)
+            if kickers:
+                article_info['kicker'] = self._text_xp(kickers[0])
+
+            images = self._image_xp(container)
+            if images:
+                article_info['image'] = urljoin(base_url, images[0])
+
+            return article_info
+
+        except Exception as e:
+            logger.error(f"Error extracting initial article data: {str(e)}")
+            return None
+
+    def _parse_listing(self, page_source: bytes, base_url: str, encoding: Optional[str] = None) -> List[Dict[str, str]]:
+        """Extract article fields from the listing HTML, streaming past everything outside the containers"""
+        article_data = []
+        container_count = 0
+        depth = 0
+
+        events = etree.iterparse(io.BytesIO(page_source), events=('start', 'end'), html=True, encoding=encoding)
+        for event, element in events:
+            is_container = 'contenedor_dato_modulo' in (element.get('class') or '').split()
+            if event == 'start':
+                depth += is_container
+                continue
+
+            if is_container:
+                depth -= 1
+                container_count += 1
+                article_info = self._extract_listing_item(element, base_url)
+                if article_info is not None:
+                    article_data.append(article_info)
+
+            if depth == 0:
+                element.clear(keep_tail=True)
+                parent = element.getparent()
+                while parent is not None and element.getprevious() is not None:
+                    del parent[0]
+
+        logger.info(f"Found {container_count} news items")
+        return article_data
+
+    def _build_articles(self, article_data: List[Dict[str, str]]) -> List[Article]:
+        """Create Article objects from the extracted article fields"""
+        articles = [None] * len(article_data)
+        for index, article_info in enumerate(article_data):
+            try:
+                articles[index] = Article(
+                    title=article_info['title'],
+                    kicker=article_info['kicker'],
+                    link=article_info['link'],
+                    image=article_info['image'],
+                    scrape_date=self._run_ts
+                )
+                logger.info(f"Processed article: {article_info['title'][:50]}... | Kicker: {article_info['kicker'][:50]}...")
 
-                article_data = []
-                article_containers = driver.find_elements(By.CLASS_NAME, "contenedor_dato_modulo")
-                logger.info(f"Found {len(article_containers)} news items")
-                
-                for container in article_containers:
-                    try:
-                        article_info = {
-                            'title': '',
-                            'link': '',
-                            'kicker': '',
-                            'image': ''
-                        }
-                        
-                        try:
-                            link_element = container.find_element(By.CLASS_NAME, "titulo").find_element(By.TAG_NAME, "a")
-                            article_info['title'] = link_element.text.strip()
-                            article_info['link'] = link_element.get_attribute("href")
-                        except NoSuchElementException:
-                            continue
-                        
-                        if not article_info['title']:
-                            continue
-
-                        kicker_selectors = [
-                            (By.CLASS_NAME, "volanta"),
-                            (By.CLASS_NAME, "volanta fuente_roboto_slab"),
-                            (By.CLASS_NAME, "volanta_noticia"),
-                            (By.CLASS_NAME, "volanta_noticia fuente_roboto_slab"),
-                            (By.CSS_SELECTOR, ".volanta_titulo .volanta"),
-                            (By.CSS_SELECTOR, "div.volanta")
-                        ]
-
-                        for selector in kicker_selectors:
-                            try:
-                                element = container.find_element(*selector)
-                                kicker_text = element.text.strip()
-                                if kicker_text:
-                                    article_info['kicker'] = kicker_text
-                                    break
-                            except NoSuchElementException:
-                                continue
-                        article_info['image'] = self._safe_find_element(container, By.TAG_NAME, "img")
-                        
-                        article_data.append(article_info)
-                        
-                    except Exception as e:
-                        logger.error(f"Error extracting initial article data: {str(e)}")
-                        continue
-                
-                for article_info in article_data:
-                    try:
-                        if not article_info['kicker'] and article_info['link']:
-                            logger.info(f"No kicker found in main page for {article_info['title'][:50]}... Checking article page...")
-                            
-                            try:
-                                driver.get(article_info['link'])
-                            except TimeoutException:
-                                logger.error(f"Timeout while accessing article page: {article_info['link']}")
-                                continue
-                            except WebDriverException as e:
-                                logger.error(f"WebDriver error while accessing article page: {str(e)}")
-                                continue
-
-                            try:
-                                WebDriverWait(driver, 10).until(
-                                    EC.presence_of_element_located((By.CLASS_NAME, "contenido_noticia"))
-                                )
-                            except TimeoutException:
-                                logger.error(f"Timeout waiting for article content to load: {article_info['link']}")
-                                continue
-
-                            article_kicker_selectors = [
-                                (By.CLASS_NAME, "volanta_noticia"),
-                                (By.CLASS_NAME, "volanta_noticia fuente_roboto_slab"),
-                                (By.CSS_SELECTOR, ".slot.contenido_fijo.titulo_de_noticia .volanta_noticia"),
-                                (By.CSS_SELECTOR, ".titulo_de_noticia .volanta_noticia")
-                            ]
-                            
-                            for selector in article_kicker_selectors:
-                                try:
-                                    element = driver.find_element(*selector)
-                                    kicker_text = element.text.strip()
-                                    if kicker_text:
-                                        article_info['kicker'] = kicker_text
-                                        break
-                                except NoSuchElementException:
-                                    continue
-                        article = Article(
-                            title=article_info['title'],
-                            kicker=article_info['kicker'],
-                            link=article_info['link'],
-                            image=article_info['image']
-                        )
-                        articles.append(article)
-                        logger.info(f"Processed article: {article_info['title'][:50]}... | Kicker: {article_info['kicker'][:50]}...")
-                        
-                    except Exception as e:
-                        logger.error(f"Error processing article page: {str(e)}")
-                        continue
-                        
             except Exception as e:
-                logger.error(f"Error during scraping: {str(e)}")
+                logger.error(f"Error processing article page: {str(e)}")
+                continue
+
+        return [article for article in articles if article is not None]
+
+    def _scrape_with_requests(self) -> List[Article]:
+        """Scrape articles from the static listing HTML, without launching a browser"""
+        logger.info(f"Accessing URL over HTTP: {self.base_url}")
+        try:
+            response = self._session.get(self.base_url, timeout=15)
+        except requests.RequestException as e:
+            logger.warning(f"HTTP error while accessing {self.base_url}: {str(e)}")
+            return []
+
+        if response.status_code != 200 or not response.content:
+            logger.warning(f"Got status {response.status_code} while accessing {self.base_url}")
+            return []
+
+        try:
+            article_data = self._parse_listing(response.content, self.base_url, _declared_charset(response))
+        except etree.LxmlError as e:
+            logger.warning(f"Could not parse listing HTML from {self.base_url}: {str(e)}")
+            return []
+
+        if not article_data:
+            logger.info("No articles found in static HTML, page needs a browser")
+            return []
+
+        self._fill_missing_kickers(article_data)
+        return self._build_articles(article_data)
+
+    def _scrape_with_selenium(self) -> List[Article]:
+        """Scrape articles using Selenium with protection against stale elements"""
+        driver = self.driver
+        try:
+            driver.delete_all_cookies()
+            logger.info(f"Accessing URL: {self.base_url}")
+            try:
+                driver.get(self.base_url)
+            except TimeoutException:
+                logger.error(f"Timeout while accessing {self.base_url}")
                 raise
-                    
-            return articles
+            except WebDriverException as e:
+                logger.error(f"WebDriver error while accessing {self.base_url}: {str(e)}")
+                raise
+
+            try:
+                WebDriverWait(driver, 20).until(
+                    EC.presence_of_element_located((By.CLASS_NAME, "contenedor_dato_modulo"))
+                )
+            except TimeoutException:
+                logger.error("Timeout waiting for article containers to load")
+                raise
+
+            listing = driver.execute_script(EXTRACT_LISTING_SCRIPT)
+            logger.info(f"Found {len(listing)} news items")
+            article_data = [article_info for article_info in listing if article_info['title']]
+
+            self._fill_missing_kickers(article_data, driver)
+            return self._build_articles(article_data)
+
+        except Exception as e:
+            logger.error(f"Error during scraping: {str(e)}")
+            self.close()
+            raise
         
-    def process_data(self, articles: List[Article]) -> Optional[pd.DataFrame]:
+    def process_data(self, articles: List[Article]) -> Optional[pa.Table]:
         """Process scraped articles and compute metrics"""
         if not articles:
             logger.error("No articles to process")
             return None
-            
-        df = pd.DataFrame([vars(article) for article in articles])
 
-        df['title_word_count'] = df['title'].str.split().str.len()
-        df['title_char_count'] = df['title'].str.len()
-        df['capital_words'] = df['title'].apply(
-            lambda x: [word for word in x.split() if word and word[0].isupper()]
-        )
-        
-        return df
+        titles = pa.array([article.title for article in articles], pa.string())
+        words = _split_words(titles)
+
+        return pa.table({
+            'title': titles,
+            'kicker': pa.array([article.kicker for article in articles], pa.string()),
+            'link': pa.array([article.link for article in articles], pa.string()),
+            'image': pa.array([article.image for article in articles], pa.string()),
+            'scrape_date': pa.array([article.scrape_date for article in articles], pa.string()).cast(pa.timestamp('us', tz='UTC')),
+            'title_word_count': pc.list_value_length(words),
+            'title_char_count': pc.utf8_length(titles),
+            'capital_words': _filter_list_values(
+                words, pc.utf8_is_upper(pc.utf8_slice_codeunits(pc.list_flatten(words), 0, 1))
+            )
+        })
+
+    def _load_table_chunk(self, client: bigquery.Client, chunk: pa.Table, table_ref: str,
+                          job_config: bigquery.LoadJobConfig):
+        """Serialize a slice of the table to Parquet and start its load job"""
+        buffer = io.BytesIO()
+        pq.write_table(chunk, buffer)
+        buffer.seek(0)
+        return client.load_table_from_file(buffer, table_ref, job_config=job_config)
 
-    def upload_to_bigquery(self, df: pd.DataFrame) -> bool:
+    def upload_to_bigquery(self, table: pa.Table) -> bool:
         """Upload processed data to BigQuery"""
-        if df is None or df.empty:
+        if table is None or table.num_rows == 0:
             logger.error("No data to upload to BigQuery")
             return False
             
         try:
-            client = bigquery.Client()
+            client = self.bq_client
             table_ref = f"{os.getenv('GCP_PROJECT_ID')}.{os.getenv('BQ_DATASET_ID')}.{os.getenv('BQ_TABLE_ID')}"
 
+            parquet_options = bigquery.ParquetOptions()
+            parquet_options.enable_list_inference = True
+
             job_config = bigquery.LoadJobConfig(
+                schema=BQ_SCHEMA,
                 write_disposition="WRITE_APPEND",
-                schema_update_options=[
-                    bigquery.SchemaUpdateOption.ALLOW_FIELD_ADDITION
-                ]
+                source_format=bigquery.SourceFormat.PARQUET,
+                parquet_options=parquet_options
             )
             
-            job = client.load_table_from_dataframe(
-                df, table_ref, job_config=job_config
-            )
-            job.result() 
+            chunks = [
+                table.slice(start, self.bq_chunk_size)
+                for start in range(0, table.num_rows, self.bq_chunk_size)
+            ]
+            with ThreadPoolExecutor(max_workers=self.bq_upload_workers) as executor:
+                jobs = [
+                    executor.submit(self._load_table_chunk, client, chunk, table_ref, job_config)
+                    for chunk in chunks
+                ]
+                for job in jobs:
+                    job.result().result()
             
-            logger.info(f"Successfully uploaded {len(df)} rows to BigQuery")
+            logger.info(f"Successfully uploaded {table.num_rows} rows to BigQuery")
             return True
             
         except Exception as e:
             logger.error(f"Error uploading to BigQuery: {str(e)}")
             return False
         
-    def save_to_csv(self, df: pd.DataFrame) -> None:
-        """Save DataFrame to CSV with timestamp"""
+    def save_to_csv(self, table: pa.Table) -> None:
+        """Save processed table to CSV with timestamp"""
         try:
             output_dir = "/app/output"
             if not os.path.exists(output_dir):
@@ -313,7 +568,11 @@ class NewsScraperProcessor:
             filepath = os.path.join(output_dir, filename)
             
             print(f"\nAttempting to save CSV to: {filepath}")
-            df.to_csv(filepath, index=False)
+            capital_words = pa.array(
+                [str(words) for words in table.column('capital_words').to_pylist()], pa.string()
+            )
+            table = table.set_column(table.schema.get_field_index('capital_words'), 'capital_words', capital_words)
+            pacsv.write_csv(table, filepath, write_options=pacsv.WriteOptions(include_header=True))
             
             if os.path.exists(filepath):
                 print(f"File successfully created. Size: {os.path.getsize(filepath)} bytes")
@@ -332,20 +591,20 @@ def main():
         
         if articles:
             logger.info(f"Successfully scraped {len(articles)} articles")
-            df = scraper.process_data(articles)
+            table = scraper.process_data(articles)
             
-            if df is not None:
-                success = scraper.upload_to_bigquery(df)
+            if table is not None:
+                success = scraper.upload_to_bigquery(table)
                 
                 if not success:
                     logger.error("Failed to upload data to BigQuery")
                     sys.exit(1)
                 
-                scraper.save_to_csv(df)
+                scraper.save_to_csv(table)
 
                 print("\nSample of processed articles:")
-                print(df[['title', 'kicker', 'title_word_count', 'title_char_count']].head())
-                print("\nExample of capital words in first article:", df['capital_words'].iloc[0])
+                print(table.select(['title', 'kicker', 'title_word_count', 'title_char_count']).slice(0, 5).to_pandas())
+                print("\nExample of capital words in first article:", table.column('capital_words')[0].as_py())
         else:
             logger.error("No articles were scraped")
             sys.exit(1)
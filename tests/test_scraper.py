@@ -1,8 +1,11 @@
 import datetime
 import sys
+import time
 from dataclasses import dataclass
 from unittest.mock import MagicMock, patch
 from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 
 sys.modules['google'] = MagicMock()
@@ -31,7 +34,10 @@ class TestNewsScraperProcessor:
     @pytest.fixture
     def scraper(self):
         from scraper import NewsScraperProcessor
-        return NewsScraperProcessor()
+        processor = NewsScraperProcessor()
+        processor._session = MagicMock()
+        processor._session.get.return_value.status_code = 503
+        return processor
 
     @pytest.fixture
     def mock_driver(self):
@@ -47,12 +53,51 @@ class TestNewsScraperProcessor:
             image="https://example.com/image.jpg"
         )
 
+    @pytest.fixture
+    def scraped_articles(self):
+        from scraper import Article as ScrapedArticle
+        return [
+            ScrapedArticle(title="Caesars Virginia sets  date for opening", kicker="", link="", image=""),
+            ScrapedArticle(title="Éxito in the Casino's “Big” week", kicker="", link="", image="")
+        ]
+
+    @pytest.fixture
+    def listing_html(self):
+        return """
+        <html><body>
+          <div class="contenedor_dato_modulo">
+            <div class="volanta_titulo"><div class="volanta fuente_roboto_slab"> Top Story </div></div>
+            <h2 class="titulo fuente_roboto_slab"><a href="/international/news/1-first">First  Article</a></h2>
+            <div class="imagen"><img src="https://example.com/first.jpg"></div>
+          </div>
+          <div class="contenedor_dato_modulo">
+            <div class="volanta_extra">Not A Kicker</div>
+            <div class="volanta"></div>
+            <h2 class="titulo"><a href="https://example.com/second">Second Article</a></h2>
+          </div>
+          <div class="contenedor_dato_modulo">
+            <h2 class="titulo"><a href="/empty"> </a></h2>
+          </div>
+          <div class="contenedor_dato_modulo"><p>No title here</p></div>
+          <div class="contenedor_dato_modulo_extra">
+            <h2 class="titulo"><a href="/other">Other Module</a></h2>
+          </div>
+        </body></html>
+        """
+
     def test_configure_chrome_options(self, scraper):
         options = scraper._configure_chrome_options()
         assert '--headless' in options.arguments
         assert '--no-sandbox' in options.arguments
         assert any('user-agent' in arg for arg in options.arguments)
 
+    def test_configure_chrome_options_blocks_heavy_resources(self, scraper):
+        options = scraper._configure_chrome_options()
+        prefs = options.experimental_options['prefs']
+        assert prefs['profile.managed_default_content_settings.images'] == 2
+        assert prefs['profile.managed_default_content_settings.fonts'] == 2
+        assert options.page_load_strategy == 'eager'
+
     def test_safe_find_element_with_no_such_element(self, scraper):
         mock_container = MagicMock()
         mock_container.find_element.side_effect = NoSuchElementException()
@@ -73,10 +118,278 @@ class TestNewsScraperProcessor:
         with pytest.raises(exception):
             scraper.scrape_news()
 
+    def test_parse_listing(self, scraper, listing_html):
+        result = scraper._parse_listing(listing_html.encode(), "https://www.yogonet.com/international/")
+        assert result == [
+            {
+                'title': 'First Article',
+                'link': 'https://www.yogonet.com/international/news/1-first',
+                'kicker': 'Top Story',
+                'image': 'https://example.com/first.jpg'
+            },
+            {
+                'title': 'Second Article',
+                'link': 'https://example.com/second',
+                'kicker': '',
+                'image': ''
+            }
+        ]
+
+    def test_get_article_kicker_uses_first_non_empty_match(self, scraper):
+        from scraper import ARTICLE_KICKER_CSS
+        mock_driver = MagicMock()
+        mock_driver.find_elements.return_value = [MagicMock(text="  "), MagicMock(text=" Test Kicker ")]
+        with patch('scraper.WebDriverWait'):
+            result = scraper._get_article_kicker(mock_driver, "https://example.com")
+        mock_driver.find_elements.assert_called_once_with("css selector", ARTICLE_KICKER_CSS)
+        assert result == "Test Kicker"
+
+    def test_fetch_kicker_http(self, scraper):
+        response = MagicMock(status_code=200, headers={'Content-Type': 'text/html'})
+        response.content = b'<html><body><div class="volanta_noticia fuente_roboto_slab"> Test Kicker </div></body></html>'
+        with patch.object(scraper._session, 'get', return_value=response) as mock_get:
+            result = scraper._fetch_kicker_http("https://example.com")
+        mock_get.assert_called_once_with("https://example.com", timeout=10)
+        assert result == "Test Kicker"
+
+    def test_fetch_kicker_http_uses_declared_charset(self, scraper):
+        response = MagicMock(status_code=200, headers={'Content-Type': 'text/html; charset=UTF-8'})
+        response.content = '<html><body><div class="volanta_noticia">Área</div></body></html>'.encode()
+        with patch.object(scraper._session, 'get', return_value=response):
+            assert scraper._fetch_kicker_http("https://example.com") == "Área"
+
+    def test_fetch_kicker_http_with_error_status(self, scraper):
+        response = MagicMock(status_code=403)
+        with patch.object(scraper._session, 'get', return_value=response):
+            result = scraper._fetch_kicker_http("https://example.com")
+        assert result == ""
+
+    def test_scrape_with_requests(self, scraper, listing_html):
+        response = MagicMock(status_code=200, content=listing_html.encode(), headers={'Content-Type': 'text/html; charset=utf-8'})
+        scraper._session.get.return_value = response
+        with patch.object(scraper, '_fetch_kicker_http', return_value="Fetched Kicker") as mock_fetch:
+            articles = scraper._scrape_with_requests()
+        mock_fetch.assert_called_once_with("https://example.com/second")
+        assert [article.title for article in articles] == ["First Article", "Second Article"]
+        assert [article.kicker for article in articles] == ["Top Story", "Fetched Kicker"]
+
+    def test_scrape_with_requests_uses_declared_charset(self, scraper):
+        listing = '<div class="contenedor_dato_modulo"><h2 class="titulo"><a href="/1">Éxito en Málaga</a></h2></div>'
+        scraper._session.get.return_value = MagicMock(
+            status_code=200, content=listing.encode(), headers={'Content-Type': 'text/html; charset=utf-8'}
+        )
+        with patch.object(scraper, '_fill_missing_kickers'):
+            articles = scraper._scrape_with_requests()
+        assert [article.title for article in articles] == ["Éxito en Málaga"]
+
+    def test_scrape_news_uses_one_timestamp_per_run(self, scraper, listing_html):
+        scraper._session.get.return_value = MagicMock(status_code=200, content=listing_html.encode(), headers={'Content-Type': 'text/html; charset=utf-8'})
+        with patch.object(scraper, '_fetch_kicker_http', return_value=""), \
+             patch.object(scraper, '_fetch_kickers_with_browser', return_value={}):
+            articles = scraper.scrape_news()
+        assert len(articles) == 2
+        assert articles[0].scrape_date == articles[1].scrape_date == scraper._run_ts
+        assert isinstance(datetime.datetime.fromisoformat(articles[0].scrape_date), datetime.datetime)
+
+    def test_scrape_with_requests_with_error_status(self, scraper):
+        assert scraper._scrape_with_requests() == []
+
+    def test_fetch_kicker_reuses_process_driver(self, scraper):
+        import scraper as scraper_module
+        with patch('scraper._worker_driver', None), \
+             patch('scraper._worker_chrome_options', None), \
+             patch('scraper.webdriver.Chrome') as mock_chrome, \
+             patch('scraper.Finalize') as mock_finalize, \
+             patch.object(scraper_module.NewsScraperProcessor, '_get_article_kicker',
+                          side_effect=lambda driver, url: f"Kicker {url[-1]}") as mock_get_kicker:
+            scraper_module._init_kicker_worker(scraper.chrome_options)
+            first = scraper_module.fetch_kicker("https://example.com/1")
+            second = scraper_module.fetch_kicker("https://example.com/2")
+        assert first == ("https://example.com/1", "Kicker 1")
+        assert second == ("https://example.com/2", "Kicker 2")
+        mock_chrome.assert_called_once()
+        assert mock_chrome.call_args.kwargs['options'] is scraper.chrome_options
+        mock_chrome.return_value.set_page_load_timeout.assert_called_once_with(30)
+        mock_finalize.assert_called_once_with(None, mock_chrome.return_value.quit, exitpriority=10)
+        mock_get_kicker.assert_called_with(mock_chrome.return_value, "https://example.com/2")
+
+    def test_fetch_kickers_with_browser_maps_results_by_url(self, scraper):
+        from scraper import _init_kicker_worker, fetch_kicker
+        urls = ['https://example.com/1', 'https://example.com/2']
+        with patch('scraper.multiprocessing.get_context') as mock_get_context:
+            pool = mock_get_context.return_value.Pool.return_value
+            pool.imap_unordered.return_value = iter([
+                ('https://example.com/2', "Second Kicker"),
+                ('https://example.com/1', "First Kicker")
+            ])
+            result = scraper._fetch_kickers_with_browser(urls)
+        assert result == {'https://example.com/1': "First Kicker", 'https://example.com/2': "Second Kicker"}
+        mock_get_context.assert_called_once_with('spawn')
+        mock_get_context.return_value.Pool.assert_called_once_with(
+            processes=2, initializer=_init_kicker_worker, initargs=(scraper.chrome_options,)
+        )
+        pool.imap_unordered.assert_called_once_with(fetch_kicker, urls)
+        pool.close.assert_called_once()
+        pool.join.assert_called_once()
+        pool.terminate.assert_not_called()
+
+    def test_fetch_kickers_in_page_keeps_pages_that_loaded(self, scraper):
+        from scraper import FETCH_PAGES_SCRIPT
+        urls = ['https://example.com/slow', 'https://example.com/ok']
+        mock_driver = MagicMock()
+        mock_driver.execute_async_script.return_value = [
+            None,
+            '<html><body><div class="volanta_noticia">Loaded Kicker</div></body></html>'
+        ]
+        result = scraper._fetch_kickers_in_page(mock_driver, urls)
+        mock_driver.execute_async_script.assert_called_once_with(FETCH_PAGES_SCRIPT, urls)
+        assert 'AbortSignal.timeout' in FETCH_PAGES_SCRIPT
+        assert result == {'https://example.com/ok': "Loaded Kicker"}
+
+    def test_fill_missing_kickers_without_browser_session(self, scraper):
+        article_data = [
+            {'title': 'First', 'link': 'https://example.com/1', 'kicker': '', 'image': ''},
+            {'title': 'Second', 'link': 'https://example.com/2', 'kicker': '', 'image': ''}
+        ]
+        with patch.object(scraper, '_fetch_kicker_http', side_effect=lambda url: "Http Kicker" if url.endswith("1") else ""), \
+             patch.object(scraper, '_fetch_kickers_with_browser', return_value={'https://example.com/2': "Browser Kicker"}) as mock_browser:
+            scraper._fill_missing_kickers(article_data)
+        mock_browser.assert_called_once_with(['https://example.com/2'])
+        assert [info['kicker'] for info in article_data] == ["Http Kicker", "Browser Kicker"]
+
+    def test_fill_missing_kickers_uses_browser_session(self, scraper):
+        article_data = [
+            {'title': 'First', 'link': 'https://example.com/1', 'kicker': '', 'image': ''},
+            {'title': 'Second', 'link': 'https://example.com/2', 'kicker': '', 'image': ''},
+            {'title': 'Third', 'link': 'https://example.com/3', 'kicker': '', 'image': ''}
+        ]
+        mock_driver = MagicMock()
+        mock_driver.execute_async_script.return_value = [
+            '<html><body><div class="volanta_noticia">Page Kicker</div></body></html>',
+            None
+        ]
+        with patch.object(scraper, '_fetch_kicker_http', side_effect=lambda url: "Http Kicker" if url.endswith("1") else ""), \
+             patch.object(scraper, '_fetch_kickers_with_browser', return_value={'https://example.com/3': "Browser Kicker"}) as mock_browser:
+            scraper._fill_missing_kickers(article_data, mock_driver)
+        assert mock_driver.execute_async_script.call_args.args[1] == ['https://example.com/2', 'https://example.com/3']
+        mock_browser.assert_called_once_with(['https://example.com/3'])
+        assert [info['kicker'] for info in article_data] == ["Http Kicker", "Page Kicker", "Browser Kicker"]
+
+    def test_scrape_with_selenium_extracts_listing_in_one_script(self, scraper, mock_driver):
+        mock_driver.execute_script.return_value = [
+            {'title': 'First Article', 'link': 'https://example.com/1', 'kicker': 'Top Story', 'image': 'first.jpg'},
+            {'title': '', 'link': 'https://example.com/2', 'kicker': '', 'image': ''}
+        ]
+        with patch('scraper.WebDriverWait'), \
+             patch.object(scraper, '_fill_missing_kickers') as mock_fill:
+            articles = scraper._scrape_with_selenium()
+        mock_driver.execute_script.assert_called_once()
+        mock_fill.assert_called_once()
+        assert [(article.title, article.kicker) for article in articles] == [('First Article', 'Top Story')]
+
+    def test_scrape_with_selenium_reuses_driver(self, scraper):
+        with patch('scraper.webdriver.Chrome') as mock_chrome, patch('scraper.WebDriverWait'):
+            mock_chrome.return_value.execute_script.return_value = []
+            scraper._scrape_with_selenium()
+            scraper._scrape_with_selenium()
+            mock_chrome.assert_called_once()
+            assert mock_chrome.return_value.delete_all_cookies.call_count == 2
+            scraper.close()
+            mock_chrome.return_value.quit.assert_called_once()
+        assert scraper._driver is None
+
+    def test_scrape_with_selenium_discards_driver_on_error(self, scraper, mock_driver):
+        mock_driver.get.side_effect = WebDriverException("WebDriver Error")
+        with pytest.raises(WebDriverException):
+            scraper._scrape_with_selenium()
+        mock_driver.quit.assert_called_once()
+        assert scraper._driver is None
+
     def test_process_data_with_empty_articles(self, scraper):
         result = scraper.process_data([])
         assert result is None
 
+    def test_process_data_metrics(self, scraper, scraped_articles):
+        table = scraper.process_data(scraped_articles)
+        assert table.column('title_word_count').to_pylist() == [6, 6]
+        assert table.column('title_char_count').to_pylist() == [39, 32]
+        assert table.column('capital_words').to_pylist() == [['Caesars', 'Virginia'], ['Éxito', "Casino's"]]
+        assert table.schema.field('title_word_count').type == pa.int32()
+        assert table.schema.field('capital_words').type == pa.list_(pa.string())
+        assert table.schema.field('scrape_date').type == pa.timestamp('us', tz='UTC')
+
+        from scraper import Article as ScrapedArticle
+        table = scraper.process_data([
+            ScrapedArticle(title="Foo\xa0Bar baz", kicker="", link="", image=""),
+            ScrapedArticle(title="\xa0Lead\vand  trail ", kicker="", link="", image="")
+        ])
+        assert table.column('title_word_count').to_pylist() == [3, 3]
+        assert table.column('capital_words').to_pylist() == [['Foo', 'Bar'], ['Lead']]
+
+    def test_process_data_capital_words_beyond_latin1(self, scraper):
+        from scraper import Article as ScrapedArticle
+        table = scraper.process_data([
+            ScrapedArticle(title="Ōsaka and Łódź host Αθήνα event", kicker="", link="", image="")
+        ])
+        assert table.column('capital_words').to_pylist() == [['Ōsaka', 'Łódź', 'Αθήνα']]
+
+    def test_upload_to_bigquery_uses_parquet(self, scraper, scraped_articles):
+        from scraper import BQ_SCHEMA
+        table = scraper.process_data(scraped_articles)
+        with patch('scraper.bigquery') as mock_bigquery:
+            assert scraper.upload_to_bigquery(table) is True
+        job_config = mock_bigquery.LoadJobConfig.call_args.kwargs
+        assert job_config['source_format'] == mock_bigquery.SourceFormat.PARQUET
+        assert job_config['schema'] is BQ_SCHEMA
+        assert 'schema_update_options' not in job_config
+        assert job_config['parquet_options'].enable_list_inference is True
+        load = mock_bigquery.Client.return_value.load_table_from_file
+        load.return_value.result.assert_called_once()
+        assert pq.read_table(load.call_args.args[0]).equals(table)
+
+    def test_upload_to_bigquery_in_chunks(self, scraper, scraped_articles):
+        table = scraper.process_data(scraped_articles * 3)
+        scraper.bq_chunk_size = 4
+        with patch('scraper.bigquery') as mock_bigquery:
+            assert scraper.upload_to_bigquery(table) is True
+        load = mock_bigquery.Client.return_value.load_table_from_file
+        assert sorted(pq.read_table(call.args[0]).num_rows for call in load.call_args_list) == [2, 4]
+
+    @pytest.mark.parametrize("value,expected", [
+        (None, 10000),
+        ("500", 500),
+        ("0", 10000),
+        ("-5", 10000),
+        ("lots", 10000),
+    ])
+    def test_bq_chunk_size_from_env(self, scraper, monkeypatch, value, expected):
+        if value is None:
+            monkeypatch.delenv('BQ_CHUNK_SIZE', raising=False)
+        else:
+            monkeypatch.setenv('BQ_CHUNK_SIZE', value)
+        assert scraper._get_bq_chunk_size() == expected
+
+    def test_upload_to_bigquery_reuses_client(self, scraper, scraped_articles):
+        table = scraper.process_data(scraped_articles * 8)
+        scraper.bq_chunk_size = 2
+        client = MagicMock()
+        with patch('scraper.bigquery') as mock_bigquery:
+            mock_bigquery.Client.side_effect = lambda: time.sleep(0.05) or client
+            assert scraper.upload_to_bigquery(table) is True
+            assert scraper.upload_to_bigquery(table) is True
+        mock_bigquery.Client.assert_called_once_with()
+        assert client.load_table_from_file.call_count == 16
+
+    def test_save_to_csv(self, scraper, scraped_articles):
+        table = scraper.process_data(scraped_articles)
+        with patch('scraper.os.path.exists', return_value=False), \
+             patch('scraper.os.makedirs'), \
+             patch('scraper.pacsv.write_csv') as mock_write:
+            scraper.save_to_csv(table)
+        written = mock_write.call_args.args[0]
+        assert mock_write.call_args.args[1].startswith("/app/output/news_scraper_results_")
+        assert written.column('capital_words').to_pylist() == ["['Caesars', 'Virginia']", "['Éxito', \"Casino's\"]"]
+
     def test_article_post_init(self):
         article = Article(
             title="Test",
@@ -87,6 +400,11 @@ class TestNewsScraperProcessor:
         assert article.scrape_date is not None
         assert isinstance(datetime.fromisoformat(article.scrape_date), datetime)
 
+    def test_article_uses_slots(self):
+        from scraper import Article as ScrapedArticle
+        article = ScrapedArticle(title="Test", kicker="Test", link="https://example.com", image="test.jpg")
+        assert not hasattr(article, '__dict__')
+
     @pytest.mark.parametrize("test_input,expected", [
         ({"title": "Test Title", "kicker": "Test", "link": "https://example.com", "image": "test.jpg"}, True),
         ({"title": "", "kicker": "Test", "link": "https://example.com", "image": "test.jpg"}, False),